@@ -1,43 +1,166 @@
+from concurrent.futures import ProcessPoolExecutor
+import importlib.util
+
+import numpy as np
 import pandas as pd
 import re
 
-def clean_amount(amount_str, role=None):
+# python-calamine parses xlsx several times faster than openpyxl, so use it
+# when installed and supported by pandas (2.2+), otherwise fall back to the
+# pandas default
+_EXCEL_ENGINE = None
+if tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2):
+    try:
+        import python_calamine  # noqa: F401
+        _EXCEL_ENGINE = 'calamine'
+    except ImportError:
+        pass
+
+# xlsxwriter is optional, it streams the output workbook row by row
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# Numba is optional, it is only used to explode very large sheets and is
+# imported on first use to keep its start-up cost off typical runs
+_HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+# Approval level thresholds, level _LEVELS[i] spans _LO[i] to _HI[i]
+_LEVELS = np.arange(1, 8)
+_LO = np.array([1, 1001.00, 5001.00, 10001.00, 25001.00, 100001.00, 1000001.00], dtype=np.float64)
+_HI = np.array([1000.99, 5000.99, 10000.99, 25000.99, 100000.99, 1000000.99, 99999999.99], dtype=np.float64)
+
+# Formatting characters stripped from amounts in a single pass
+_STRIP_CHARS = ' ,"'
+_STRIP_TBL = str.maketrans('', '', _STRIP_CHARS)
+_STRIP_RE = re.compile(f'[{re.escape(_STRIP_CHARS)}]')
+
+def clean_amount(amount_str, role=None, *, is_reviewer=None):
     """
     Clean amount string by removing spaces, commas, and converting to float
     Handle "-" differently based on role:
     - Reviewers: "-" becomes 0 (or null)
     - Approvers: "-" becomes 1
+    Callers that already know the role can pass the keyword-only is_reviewer
+    flag instead of role
     """ 
+    # Numbers read straight from Excel need no cleaning
+    if isinstance(amount_str, (int, float, np.number)) and not isinstance(amount_str, bool) and not pd.isna(amount_str):
+        return float(amount_str)
+    
+    if is_reviewer is None:
+        is_reviewer = bool(role) and 'reviewer' in role.lower()
+    default = 0 if is_reviewer else 1
+    
     if pd.isna(amount_str) or str(amount_str).strip() == '-':
-        if role and 'reviewer' in role.lower():
-            return 0 
-        else:
-            return 1  
+        return default
     
     # Clean up formatting issues
-    cleaned = str(amount_str).replace(' ', '').replace(',', '').replace('"', '').strip()
+    cleaned = str(amount_str).translate(_STRIP_TBL).strip()
     
     try:
         return float(cleaned)
     except ValueError:
-        if role and 'reviewer' in role.lower():
-            return 0
-        else:
-            return 1
+        return default
 
-def transform_sheet_to_oracle(df, sheet_name):
-    # Transform a single sheet's data to Oracle format
-    # Approval level thresholds
-    approval_levels = [
-        {"level": 1, "amount_from": 1, "amount_to": 1000.99},
-        {"level": 2, "amount_from": 1001.00, "amount_to": 5000.99},
-        {"level": 3, "amount_from": 5001.00, "amount_to": 10000.99},
-        {"level": 4, "amount_from": 10001.00, "amount_to": 25000.99},
-        {"level": 5, "amount_from": 25001.00, "amount_to": 100000.99},
-        {"level": 6, "amount_from": 100001.00, "amount_to": 1000000.99},
-        {"level": 7, "amount_from": 1000001.00, "amount_to": 99999999.99}
-    ]
+def clean_amount_column(amounts, is_reviewer):
+    """
+    Vectorized version of clean_amount for a whole column
+    Handle "-" and unparseable values based on the per-row reviewer mask:
+    - Reviewers: become 0
+    - Approvers: become 1
+    """
+    # Numeric cells parse directly, only the rest go through string cleaning
+    # Booleans are not amounts, keep them out of the fast path so they fall
+    # back to the role default like any other unparseable value
+    # Only object columns can mix bools with other values, so only those
+    # need the per-cell check
+    if pd.api.types.is_bool_dtype(amounts):
+        is_bool = np.full(len(amounts), True)
+    elif amounts.dtype == object:
+        is_bool = amounts.map(type).eq(bool).values
+    else:
+        is_bool = np.full(len(amounts), False)
+    numbers = pd.to_numeric(amounts.mask(is_bool), errors='coerce')
+    needs_cleaning = numbers.isna() & amounts.notna()
+    if needs_cleaning.any():
+        cleaned = amounts[needs_cleaning].astype(str).str.replace(_STRIP_RE, '', regex=True).str.strip()
+        numbers[needs_cleaning] = pd.to_numeric(cleaned, errors='coerce')
+    return np.where(numbers.isna(), np.where(is_reviewer, 0, 1), numbers)
+
+# Sheets with at least this many rows are exploded with the Numba kernel
+_NUMBA_MIN_ROWS = 100000
+
+def _explode_levels_loop(threshold_from, threshold_to, keep, lo, hi):
+    # Two-pass loop equivalent of _explode_levels_numpy, compiled with Numba
+    # First pass counts the output rows, second pass fills them in
+    count = 0
+    for i in range(len(threshold_from)):
+        if keep[i]:
+            for j in range(len(lo)):
+                if max(threshold_from[i], lo[j]) <= min(threshold_to[i], hi[j]):
+                    count += 1
     
+    row_idx = np.empty(count, dtype=np.int64)
+    lvl_idx = np.empty(count, dtype=np.int64)
+    range_starts = np.empty(count, dtype=np.float64)
+    range_ends = np.empty(count, dtype=np.float64)
+    k = 0
+    for i in range(len(threshold_from)):
+        if keep[i]:
+            for j in range(len(lo)):
+                range_start = max(threshold_from[i], lo[j])
+                range_end = min(threshold_to[i], hi[j])
+                if range_start <= range_end:
+                    row_idx[k] = i
+                    lvl_idx[k] = j
+                    range_starts[k] = range_start
+                    range_ends[k] = range_end
+                    k += 1
+    return row_idx, lvl_idx, range_starts, range_ends
+
+_explode_levels_kernel = None
+
+def _get_explode_levels_kernel():
+    # Compile _explode_levels_loop with Numba on first use and cache it
+    global _explode_levels_kernel
+    if _explode_levels_kernel is None:
+        import numba
+        _explode_levels_kernel = numba.njit(cache=True)(_explode_levels_loop)
+    return _explode_levels_kernel
+
+def _explode_levels_numpy(threshold_from, threshold_to, keep):
+    # Clip every row's threshold range against every approval level at once (N x 7)
+    range_starts = np.maximum(threshold_from[:, None], _LO[None, :])
+    range_ends = np.minimum(threshold_to[:, None], _HI[None, :])
+    overlaps = (range_starts <= range_ends) & keep[:, None]
+    row_idx, lvl_idx = np.nonzero(overlaps)
+    return row_idx, lvl_idx, range_starts[row_idx, lvl_idx], range_ends[row_idx, lvl_idx]
+
+def _explode_levels(threshold_from, threshold_to, keep):
+    """
+    Expand the kept rows into one entry per overlapping approval level
+    Returns the row index, level index, clipped start and clipped end of
+    every entry, in row then level order
+    """
+    if _HAS_NUMBA and len(threshold_from) >= _NUMBA_MIN_ROWS:
+        return _get_explode_levels_kernel()(
+            np.ascontiguousarray(threshold_from, dtype=np.float64),
+            np.ascontiguousarray(threshold_to, dtype=np.float64),
+            np.ascontiguousarray(keep, dtype=np.bool_),
+            _LO, _HI
+        )
+    return _explode_levels_numpy(threshold_from, threshold_to, keep)
+
+def _last_match(columns, mask):
+    # Return the last column selected by a boolean mask, or None
+    matches = np.flatnonzero(mask)
+    return columns[matches[-1]] if len(matches) else None
+
+def transform_sheet_to_oracle(df, sheet_name, verbose=False):
+    # Transform a single sheet's data to Oracle format
+    # Set verbose to print every generated entry
     # Clean column names
     df.columns = df.columns.str.strip()
     
@@ -46,24 +169,28 @@ def transform_sheet_to_oracle(df, sheet_name):
     print(df.head())
     
     # Column Name Identification - Auto-Detection
-    cost_center_col = None
-    oracle_id_col = None
-    threshold_from_col = None
-    threshold_to_col = None
-    role_col = None
+    # Each column is claimed by the first role it matches, and the last
+    # column matching a role wins
+    low = df.columns.str.lower()
+    
+    def has(word):
+        # Mask of the columns whose lowercased name contains word
+        return low.str.contains(word, regex=False)
     
-    for col in df.columns:
-        col_lower = col.lower()
-        if 'cost' in col_lower and 'center' in col_lower: 
-            cost_center_col = col
-        elif 'oracle' in col_lower and 'id' in col_lower:
-            oracle_id_col = col
-        elif 'threshold' in col_lower and 'from' in col_lower:
-            threshold_from_col = col
-        elif 'threshold' in col_lower and ('to' in col_lower or 'too' in col_lower):
-            threshold_to_col = col
-        elif 'role' in col_lower or 'type' in col_lower:
-            role_col = col
+    is_cost_center = has('cost') & has('center')
+    is_oracle_id = ~is_cost_center & has('oracle') & has('id')
+    claimed = is_cost_center | is_oracle_id
+    is_threshold_from = ~claimed & has('threshold') & has('from')
+    claimed |= is_threshold_from
+    is_threshold_to = ~claimed & has('threshold') & has('to')
+    claimed |= is_threshold_to
+    is_role = ~claimed & (has('role') | has('type'))
+    
+    cost_center_col = _last_match(df.columns, is_cost_center)
+    oracle_id_col = _last_match(df.columns, is_oracle_id)
+    threshold_from_col = _last_match(df.columns, is_threshold_from)
+    threshold_to_col = _last_match(df.columns, is_threshold_to)
+    role_col = _last_match(df.columns, is_role)
     
     print(f"{sheet_name} Sheet - Identified columns:")
     print(f"  Cost Center: {cost_center_col}")
@@ -79,114 +206,92 @@ def transform_sheet_to_oracle(df, sheet_name):
         print("Available columns:", df.columns.tolist())
         return None
     
-    # Check if row does not contain a Cost Center or Oracle ID
-    df = df.dropna(subset=[cost_center_col, oracle_id_col], how='all')
+    # Skip rows missing a Cost Center or Oracle ID before any cleaning
+    df = df.dropna(subset=[cost_center_col, oracle_id_col], how='any')
     
-    # Create list to store transformed rows
-    transformed_rows = []
+    # Keep only the identified columns, renamed to short names for column lookups
+    used_cols = [cost_center_col, oracle_id_col, threshold_from_col, threshold_to_col]
+    if role_col:
+        used_cols.append(role_col)
+    rows = df[used_cols].rename(columns={
+        cost_center_col: 'cc',
+        oracle_id_col: 'oid',
+        threshold_from_col: 'tf',
+        threshold_to_col: 'tt',
+        role_col: 'role'
+    })
     
-    for index, row in df.iterrows():
-        cost_center = row[cost_center_col]
-        oracle_id = row[oracle_id_col]
-        
-        # Get role if available
-        role = row[role_col] if role_col else 'Approver'  # Default to Approver
-        
-        # Clean amounts based on role
-        threshold_from = clean_amount(row[threshold_from_col], role)
-        threshold_to = clean_amount(row[threshold_to_col], role)
-        
-        # Skip rows with missing essential data
-        if pd.isna(cost_center) or pd.isna(oracle_id):
-            continue
-            
-        print(f"{sheet_name} - Processing: Cost Center={cost_center}, Oracle ID={oracle_id}, Role={role}, From={threshold_from}, To={threshold_to}")
-        
-        # Determine if this person is a reviewer or approver
-        is_reviewer = role and 'reviewer' in str(role).lower()
-        
-        if is_reviewer:
-            # For reviewers with 0 thresholds, create a single entry with 0 amounts
-            if threshold_from == 0 and threshold_to == 0:
-                new_row = {
-                    'Cost Center': cost_center,
-                    'Level': '',
-                    'Type': 'Employee',
-                    'Role': 'REVIEWER',
-                    'Oracle ID': oracle_id,
-                    'Threshold Amount From': '',
-                    'Threshold Amount To': ''
-                } 
-                transformed_rows.append(new_row)
-                print(f"  Added reviewer entry: 0 - 0")
-            else:
-                # For reviewers with specific thresholds, map to appropriate levels
-                for level_info in approval_levels:
-                    range_start = max(threshold_from, level_info['amount_from'])
-                    range_end = min(threshold_to, level_info['amount_to'])
-                    
-                    if range_start <= range_end:
-                        new_row = {
-                            'Cost Center': cost_center,
-                            'Level': level_info['level'],
-                            'Type': 'Employee',
-                            'Role': 'REVIEWER',
-                            'Oracle ID': oracle_id,
-                            'Threshold Amount From': range_start,
-                            'Threshold Amount To': range_end
-                        }
-                        transformed_rows.append(new_row)
-                        print(f"  Added reviewer level {level_info['level']}: {range_start} - {range_end}")
-        else:
-            # For approvers determine the threshold range
-            # Check if this is a full range case (from 1 to very high amount)
-            is_full_range = (
-                threshold_from == 1 and threshold_to >= 99999999
-            )
-            
-            if is_full_range:
-                # Create 7 rows, one for each approval level
-                for level_info in approval_levels:
-                    new_row = {
-                        'Cost Center': cost_center,
-                        'Level': level_info['level'],
-                        'Type': 'Employee',
-                        'Role': 'APPROVER',
-                        'Oracle ID': oracle_id,
-                        'Threshold Amount From': level_info['amount_from'],
-                        'Threshold Amount To': level_info['amount_to']
-                    }
-                    transformed_rows.append(new_row)
-                    print(f"  Added approver level {level_info['level']}: {level_info['amount_from']} - {level_info['amount_to']}")
-            else:
-                # For specific ranges, determine which level(s) they fall into
-                for level_info in approval_levels:
-                    # Check if the threshold range overlaps with this approval level
-                    range_start = max(threshold_from, level_info['amount_from'])
-                    range_end = min(threshold_to, level_info['amount_to'])
-                    
-                    if range_start <= range_end:
-                        new_row = {
-                            'Cost Center': cost_center,
-                            'Level': level_info['level'],
-                            'Type': 'Employee', 
-                            'Role': 'APPROVER',
-                            'Oracle ID': oracle_id,
-                            'Threshold Amount From': range_start,
-                            'Threshold Amount To': range_end
-                        }
-                        transformed_rows.append(new_row)
-                        print(f"  Added approver level {level_info['level']}: {range_start} - {range_end}")
+    # Build the reviewer mask once, it drives threshold cleaning, the
+    # zero-threshold reviewer entries and the output Role label
+    if role_col:
+        # Only a handful of distinct roles exist, so check each category once
+        # and look rows up by their integer code (-1 for missing selects False)
+        roles = rows['role'].astype('category')
+        reviewer_categories = roles.cat.categories.astype(str).str.contains('reviewer', case=False, na=False)
+        is_reviewer = np.append(np.asarray(reviewer_categories, dtype=bool), False)[roles.cat.codes.values]
+    else:
+        is_reviewer = np.zeros(len(rows), dtype=bool)
+    
+    # Clean both threshold columns in one vectorized pass based on role
+    rows['tf'] = clean_amount_column(rows['tf'], is_reviewer)
+    rows['tt'] = clean_amount_column(rows['tt'], is_reviewer)
+    
+    threshold_from = rows['tf'].values
+    threshold_to = rows['tt'].values
+    
+    # Reviewers with 0 thresholds get a single entry without levels or amounts
+    is_zero_reviewer = is_reviewer & (threshold_from == 0) & (threshold_to == 0)
     
-    # Create DataFrame from transformed rows
-    result_df = pd.DataFrame(transformed_rows)
+    # Approvers covering the full range (from 1 to very high amount) get all 7
+    # levels in full, so round their upper bound up to the top of level 7
+    is_full_range = ~is_reviewer & (threshold_from == 1) & (threshold_to >= 99999999)
+    threshold_to = np.where(is_full_range, np.maximum(threshold_to, _HI[-1]), threshold_to)
+    
+    # Explode each row into the levels it overlaps, in row then level order
+    row_idx, lvl_idx, range_starts, range_ends = _explode_levels(
+        threshold_from, threshold_to, ~is_zero_reviewer
+    )
+    cost_centers = rows['cc'].values
+    oracle_ids = rows['oid'].values
+    
+    level_df = pd.DataFrame({
+        'Cost Center': cost_centers[row_idx],
+        'Level': _LEVELS[lvl_idx],
+        'Type': 'Employee',
+        'Role': np.where(is_reviewer[row_idx], 'REVIEWER', 'APPROVER'),
+        'Oracle ID': oracle_ids[row_idx],
+        'Threshold Amount From': range_starts,
+        'Threshold Amount To': range_ends
+    })
+    zero_reviewer_df = pd.DataFrame({
+        'Cost Center': cost_centers[is_zero_reviewer],
+        'Level': '',
+        'Type': 'Employee',
+        'Role': 'REVIEWER',
+        'Oracle ID': oracle_ids[is_zero_reviewer],
+        'Threshold Amount From': '',
+        'Threshold Amount To': ''
+    })
+    # Only concat non-empty frames, an empty one would turn the numeric
+    # columns into object and warns on older pandas
+    frames = [frame for frame in (level_df, zero_reviewer_df) if len(frame)]
+    result_df = pd.concat(frames, ignore_index=True) if frames else level_df
+    
+    if verbose:
+        # Zip only the columns that are logged, no index or row tuples needed
+        logged = ['Cost Center', 'Level', 'Role', 'Oracle ID', 'Threshold Amount From', 'Threshold Amount To']
+        for cost_center, level, role, oracle_id, amount_from, amount_to in zip(*(result_df[col].values for col in logged)):
+            print(f"{sheet_name} - Added {role.lower()} level {level or '-'}: Cost Center={cost_center}, Oracle ID={oracle_id}, From={amount_from or 0}, To={amount_to or 0}")
     
     if len(result_df) == 0:
         print(f"{sheet_name} Sheet - No data was transformed. Please check your input file format.")
         return None
     
-    # Sort by Cost Center and Level for better organization
-    result_df = result_df.sort_values(['Cost Center', 'Oracle ID', 'Level'])
+    # Sort by Cost Center and Oracle ID for better organization
+    # Each input row's entries are emitted in level order and a stable sort
+    # keeps them that way, but when a Cost Center/Oracle ID pair appears on
+    # several input rows its entries stay grouped by input row, not by level
+    result_df = result_df.sort_values(['Cost Center', 'Oracle ID'], kind='stable')
     
     print(f"{sheet_name} Sheet - Transformation complete!")
     print(f"  Original rows: {len(df)}")
@@ -194,51 +299,80 @@ def transform_sheet_to_oracle(df, sheet_name):
     
     return result_df
 
-def transform_sam_to_oracle(input_file):
+def _write_output(result_df, output_file):
+    """
+    Save a transformed sheet, as CSV if the file name ends in .csv
+    Excel files are streamed with xlsxwriter in constant memory mode when
+    available; pandas' own to_excel writes column by column, which that mode
+    does not support, so the rows are written here directly
+    """
+    if output_file.endswith('.csv'):
+        result_df.to_csv(output_file, index=False)
+    elif xlsxwriter is not None:
+        workbook = xlsxwriter.Workbook(output_file, {'constant_memory': True, 'strings_to_numbers': False})
+        try:
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, result_df.columns)
+            for row_num, row in enumerate(result_df.itertuples(index=False, name=None), start=1):
+                worksheet.write_row(row_num, 0, row)
+        finally:
+            workbook.close()
+    else:
+        result_df.to_excel(output_file, index=False)
+
+def _process_sheet(sheet_df, sheet_name, output_file, verbose=False):
+    # Transform and save a single sheet, in a worker process when run in parallel
+    print("\n" + "="*60)
+    print(f"PROCESSING {sheet_name.upper()} SHEET")
+    print("="*60)
+    
+    sheet_result = transform_sheet_to_oracle(sheet_df, sheet_name, verbose)
+    
+    if sheet_result is not None:
+        _write_output(sheet_result, output_file)
+        print(f"{sheet_name} sheet saved to: {output_file}")
+    else:
+        print(f"Failed to process {sheet_name} sheet")
+
+def transform_sam_to_oracle(input_file, verbose=False, output_format='xlsx', parallel=False):
     """
     Transform SAM data to Oracle format for both General and Research sheets
+    Both sheets are read in a single pass, then each one is transformed and
+    saved in turn, or in its own process when parallel is True
+    (the caller then needs an if __name__ == "__main__": guard on macOS/Windows)
+    output_format is 'xlsx' (default) or 'csv', which is much faster to write
     """
     
     try:
+        if output_format not in ('xlsx', 'csv'):
+            raise ValueError(f"Unsupported output format: {output_format}")
+
         # Read all sheets from the Excel file
-        excel_file = pd.ExcelFile(input_file)
+        excel_file = pd.ExcelFile(input_file, engine=_EXCEL_ENGINE)
         print("Available sheets:", excel_file.sheet_names)
         
-        # Process General sheet
-        if 'General' in excel_file.sheet_names:
-            print("\n" + "="*60)
-            print("PROCESSING GENERAL SHEET")
-            print("="*60)
-            
-            general_df = pd.read_excel(input_file, sheet_name='General')
-            general_result = transform_sheet_to_oracle(general_df, 'General')
-            
-            if general_result is not None:
-                general_output = "Oracle_Import_General.xlsx"
-                general_result.to_excel(general_output, index=False)
-                print(f"General sheet saved to: {general_output}")
+        sheets = []
+        for sheet_name in ['General', 'Research']:
+            if sheet_name in excel_file.sheet_names:
+                sheets.append((sheet_name, f"Oracle_Import_{sheet_name}.{output_format}"))
             else:
-                print("Failed to process General sheet")
-        else:
-            print("Warning: 'General' sheet not found")
+                print(f"Warning: '{sheet_name}' sheet not found")
         
-        # Process Research sheet
-        if 'Research' in excel_file.sheet_names:
-            print("\n" + "="*60)
-            print("PROCESSING RESEARCH SHEET")
-            print("="*60)
+        if sheets:
+            sheet_dfs = pd.read_excel(excel_file, sheet_name=[sheet_name for sheet_name, _ in sheets])
             
-            research_df = pd.read_excel(input_file, sheet_name='Research')
-            research_result = transform_sheet_to_oracle(research_df, 'Research')
-            
-            if research_result is not None:
-                research_output = "Oracle_Import_Research.xlsx"
-                research_result.to_excel(research_output, index=False)
-                print(f"Research sheet saved to: {research_output}")
+            if not parallel:
+                for sheet_name, output_file in sheets:
+                    _process_sheet(sheet_dfs[sheet_name], sheet_name, output_file, verbose)
             else:
-                print("Failed to process Research sheet")
-        else:
-            print("Warning: 'Research' sheet not found")
+                with ProcessPoolExecutor(max_workers=len(sheets)) as executor:
+                    futures = [
+                        executor.submit(_process_sheet, sheet_dfs[sheet_name], sheet_name, output_file, verbose)
+                        for sheet_name, output_file in sheets
+                    ]
+                    # Re-raise any error from the workers
+                    for future in futures:
+                        future.result()
             
         return True
         
@@ -248,12 +382,12 @@ def transform_sam_to_oracle(input_file):
         traceback.print_exc()
         return False
 
-def preview_transformation(input_file, num_rows=3):
+def preview_transformation(input_file, num_rows=3, verbose=False):
     """
     Preview the transformation for both sheets without saving to file
     """
     try:
-        excel_file = pd.ExcelFile(input_file)
+        excel_file = pd.ExcelFile(input_file, engine=_EXCEL_ENGINE)
         print("Available sheets:", excel_file.sheet_names)
         
         # Preview General sheet
@@ -261,11 +395,11 @@ def preview_transformation(input_file, num_rows=3):
             print("\n" + "="*50)
             print("GENERAL SHEET PREVIEW")
             print("="*50)
-            general_df = pd.read_excel(input_file, sheet_name='General')
+            general_df = pd.read_excel(excel_file, sheet_name='General')
             print("Original General data:")
             print(general_df.head(num_rows))
             
-            general_result = transform_sheet_to_oracle(general_df, 'General')
+            general_result = transform_sheet_to_oracle(general_df, 'General', verbose)
             if general_result is not None:
                 print("\nTransformed General data preview:")
                 print(general_result.head(10))
@@ -275,11 +409,11 @@ def preview_transformation(input_file, num_rows=3):
             print("\n" + "="*50)
             print("RESEARCH SHEET PREVIEW")
             print("="*50)
-            research_df = pd.read_excel(input_file, sheet_name='Research')
+            research_df = pd.read_excel(excel_file, sheet_name='Research')
             print("Original Research data:")
             print(research_df.head(num_rows))
             
-            research_result = transform_sheet_to_oracle(research_df, 'Research')
+            research_result = transform_sheet_to_oracle(research_df, 'Research', verbose)
             if research_result is not None:
                 print("\nTransformed Research data preview:")
                 print(research_result.head(10))